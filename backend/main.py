@@ -5,6 +5,10 @@ from backend.models.base import Base, engine
 from backend.routers import auth, jobs, proposals, contracts
 
 Base.metadata.create_all(bind=engine)
+# create_all skips indexes on tables that already exist
+for model in (proposal.Proposal, contract.Contract):
+    for index in model.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
 
 app = FastAPI()
 
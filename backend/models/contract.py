@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, Text, ForeignKey, String, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (
+        Index("ix_contracts_freelancer_id_status", "freelancer_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(Integer, nullable=False)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, String, Boolean
+from sqlalchemy import Column, Integer, Text, ForeignKey, String, Boolean, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
 
 class Proposal(Base):
     __tablename__ = "proposals"
+    __table_args__ = (
+        Index("ix_proposals_job_id_bid_amount", "job_id", "bid_amount"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     bid_amount = Column(Integer, nullable=False)
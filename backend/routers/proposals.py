@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, defer
 from pydantic import BaseModel, Field
-from typing import Annotated, List
+from typing import Annotated, List, Literal, Optional
 from .auth import get_current_user
 
 from backend.models.base import SessionLocal
 from backend.models.proposal import Proposal
+from backend.models.contract import Contract
+from backend.models.job import Job
 from backend.models.user import User
 
 
@@ -40,6 +43,50 @@ class ProposalCreate(BaseModel):
     cover_letter: str | None = None
 
 
+class RankedProposalRead(ProposalRead):
+    freelancer_reputation: int = Field(
+        0, description="Number of completed contracts of the freelancer")
+
+
+class BidStats(BaseModel):
+    min_bid: Optional[int] = None
+    median_bid: Optional[float] = None
+    max_bid: Optional[int] = None
+
+
+class ProposalPage(BaseModel):
+    items: List[RankedProposalRead]
+    total: int
+    stats: BidStats
+
+
+def _get_owned_job(job_id: int, user: dict, db: Session) -> Job:
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Job not found")
+    if not job.client_id == user["user_id"]:
+        raise HTTPException(status.HTTP_403_FORBIDDEN,
+                            detail="Proposals can only be viewed by job owner")
+    return job
+
+
+def _bid_stats(job_id: int, total: int, db: Session) -> BidStats:
+    """Min, median and max bid for a job, read off the (job_id, bid_amount) index."""
+    if total == 0:
+        return BidStats()
+
+    min_bid, max_bid = db.query(
+        func.min(Proposal.bid_amount), func.max(Proposal.bid_amount)
+    ).filter(Proposal.job_id == job_id).one()
+
+    middle = db.query(Proposal.bid_amount).filter(
+        Proposal.job_id == job_id
+    ).order_by(Proposal.bid_amount).offset((total - 1) // 2).limit(2 - total % 2).all()
+    median_bid = sum(bid for (bid,) in middle) / len(middle)
+
+    return BidStats(min_bid=min_bid, median_bid=median_bid, max_bid=max_bid)
+
+
 @router.get("/", response_model=List[ProposalRead])
 def get_proposals_by_user(user: user_dependency, db: db_dependency):
     proposals = db.query(Proposal).filter(
@@ -48,9 +95,76 @@ def get_proposals_by_user(user: user_dependency, db: db_dependency):
     return proposals
 
 
-@router.get("/{job_id}", response_model=List[ProposalRead])
-def get_proposals_by_job(job_id: int, user: user_dependency, db: db_dependency):
-    proposals = db.query(Proposal).filter(Proposal.job_id == job_id).all()
+@router.get("/{job_id}", response_model=ProposalPage)
+def get_proposals_by_job(
+    job_id: int,
+    user: user_dependency,
+    db: db_dependency,
+    sort: Literal["bid_amount", "recent", "reputation"] = Query(
+        "recent", description="Order by lowest bid, newest first or freelancer reputation"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    include_cover_letter: bool = Query(
+        True, description="Set to false to omit cover letter bodies"),
+):
+    _get_owned_job(job_id, user, db)
+
+    bidders = select(Proposal.freelancer_id).where(Proposal.job_id == job_id)
+    completed = db.query(
+        Contract.freelancer_id,
+        func.count(Contract.id).label("completed_contracts")
+    ).filter(
+        Contract.freelancer_id.in_(bidders),
+        Contract.status == "completed"
+    ).group_by(Contract.freelancer_id).subquery()
+    reputation = func.coalesce(completed.c.completed_contracts, 0)
+
+    query = db.query(Proposal, reputation).outerjoin(
+        completed, completed.c.freelancer_id == Proposal.freelancer_id
+    ).filter(Proposal.job_id == job_id)
+
+    if not include_cover_letter:
+        query = query.options(defer(Proposal.cover_letter))
+
+    if sort == "bid_amount":
+        query = query.order_by(Proposal.bid_amount, Proposal.id)
+    elif sort == "reputation":
+        query = query.order_by(reputation.desc(), Proposal.bid_amount, Proposal.id)
+    else:
+        # ids are assigned in insertion order, so the newest proposal has the highest id
+        query = query.order_by(Proposal.id.desc())
+
+    rows = query.offset(skip).limit(limit).all()
+    total = db.query(func.count(Proposal.id)).filter(
+        Proposal.job_id == job_id).scalar()
+
+    items = [
+        RankedProposalRead(
+            id=proposal.id,
+            bid_amount=proposal.bid_amount,
+            cover_letter=proposal.cover_letter if include_cover_letter else None,
+            job_id=proposal.job_id,
+            freelancer_id=proposal.freelancer_id,
+            freelancer_reputation=score,
+        )
+        for proposal, score in rows
+    ]
+
+    return ProposalPage(items=items, total=total, stats=_bid_stats(job_id, total, db))
+
+
+@router.get("/{job_id}/top", response_model=List[ProposalRead])
+def get_top_proposals(
+    job_id: int,
+    user: user_dependency,
+    db: db_dependency,
+    k: int = Query(5, ge=1, le=100, description="Number of lowest bids to return"),
+):
+    _get_owned_job(job_id, user, db)
+
+    proposals = db.query(Proposal).filter(
+        Proposal.job_id == job_id
+    ).order_by(Proposal.bid_amount, Proposal.id).limit(k).all()
 
     return proposals
 
@@ -0,0 +1,49 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models import user, job, proposal, contract, message
+from backend.models.base import Base
+from backend.routers import auth, jobs, proposals, contracts
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSession = sessionmaker(autoflush=False, autocommit=False, bind=engine)
+
+    session = TestingSession()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def current_user():
+    """Mutable stand-in for the JWT payload; tests set `user_id` to act as a user."""
+    return {"user_id": None, "email": "test@example.com"}
+
+
+@pytest.fixture
+def client(db, current_user):
+    app = FastAPI()
+    for module in (auth, jobs, proposals, contracts):
+        app.include_router(module.router)
+
+    def get_test_session():
+        yield db
+
+    for module in (auth, jobs, proposals, contracts):
+        app.dependency_overrides[module.get_session] = get_test_session
+    app.dependency_overrides[auth.get_current_user] = lambda: current_user
+
+    with TestClient(app) as test_client:
+        yield test_client
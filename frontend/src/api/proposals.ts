@@ -1,5 +1,5 @@
 import apiClient from './client';
-import { Proposal, ProposalCreate } from '../types';
+import { Proposal, ProposalCreate, ProposalFilters, ProposalPage } from '../types';
 
 export const proposalsApi = {
   getMyProposals: async (): Promise<Proposal[]> => {
@@ -7,8 +7,24 @@ export const proposalsApi = {
     return response.data;
   },
 
-  getJobProposals: async (jobId: number): Promise<Proposal[]> => {
-    const response = await apiClient.get(`/proposals/${jobId}`);
+  getJobProposals: async (jobId: number, filters?: ProposalFilters): Promise<ProposalPage> => {
+    const params = new URLSearchParams();
+    if (filters?.sort) params.append('sort', filters.sort);
+    if (filters?.skip) params.append('skip', filters.skip.toString());
+    if (filters?.limit) params.append('limit', filters.limit.toString());
+    if (filters?.include_cover_letter !== undefined) {
+      params.append('include_cover_letter', filters.include_cover_letter.toString());
+    }
+
+    const response = await apiClient.get(`/proposals/${jobId}`, { params });
+    return response.data;
+  },
+
+  getTopProposals: async (jobId: number, k?: number): Promise<Proposal[]> => {
+    const params = new URLSearchParams();
+    if (k) params.append('k', k.toString());
+
+    const response = await apiClient.get(`/proposals/${jobId}/top`, { params });
     return response.data;
   },
 
@@ -3,13 +3,17 @@ import { useParams, Link, useNavigate } from 'react-router-dom';
 import { jobsApi } from '../api/jobs';
 import { proposalsApi } from '../api/proposals';
 import { contractsApi } from '../api/contracts';
-import { Job, Proposal, ProposalCreate } from '../types';
+import { Job, RankedProposal, ProposalCreate } from '../types';
 import { useAuth } from '../context/AuthContext';
 
+const PROPOSALS_PAGE_SIZE = 20;
+
 const JobDetail: React.FC = () => {
   const { id } = useParams<{ id: string }>();
   const [job, setJob] = useState<Job | null>(null);
-  const [proposals, setProposals] = useState<Proposal[]>([]);
+  const [proposals, setProposals] = useState<RankedProposal[]>([]);
+  const [totalProposals, setTotalProposals] = useState(0);
+  const [loadingProposals, setLoadingProposals] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [showProposalForm, setShowProposalForm] = useState(false);
@@ -24,10 +28,16 @@ const JobDetail: React.FC = () => {
   useEffect(() => {
     if (id) {
       loadJob();
-      loadProposals();
     }
   }, [id]);
 
+  useEffect(() => {
+    // Proposals are only visible to the job owner
+    if (job && user?.id === job.client_id) {
+      loadProposals();
+    }
+  }, [job, user]);
+
   const loadJob = async () => {
     try {
       const jobs = await jobsApi.getJobs({ limit: 100 });
@@ -44,12 +54,19 @@ const JobDetail: React.FC = () => {
     }
   };
 
-  const loadProposals = async () => {
+  const loadProposals = async (skip = 0) => {
+    setLoadingProposals(true);
     try {
-      const data = await proposalsApi.getJobProposals(parseInt(id!));
-      setProposals(data);
+      const data = await proposalsApi.getJobProposals(parseInt(id!), {
+        skip,
+        limit: PROPOSALS_PAGE_SIZE,
+      });
+      setProposals((prev) => (skip === 0 ? data.items : [...prev, ...data.items]));
+      setTotalProposals(data.total);
     } catch (err: any) {
       console.error('Failed to load proposals:', err);
+    } finally {
+      setLoadingProposals(false);
     }
   };
 
@@ -71,7 +88,6 @@ const JobDetail: React.FC = () => {
       await proposalsApi.createProposal(parseInt(id!), proposalForm);
       setShowProposalForm(false);
       setProposalForm({ bid_amount: 0, cover_letter: '' });
-      loadProposals();
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Failed to submit proposal');
     } finally {
@@ -240,7 +256,7 @@ const JobDetail: React.FC = () => {
 
       {isOwner && (
         <div className="bg-white shadow-md rounded-lg p-6">
-          <h2 className="text-xl font-semibold mb-4">Proposals ({proposals.length})</h2>
+          <h2 className="text-xl font-semibold mb-4">Proposals ({totalProposals})</h2>
           {proposals.length === 0 ? (
             <p className="text-gray-500">No proposals yet</p>
           ) : (
@@ -267,6 +283,17 @@ const JobDetail: React.FC = () => {
                   </div>
                 </div>
               ))}
+              {proposals.length < totalProposals && (
+                <button
+                  onClick={() => loadProposals(proposals.length)}
+                  disabled={loadingProposals}
+                  className="w-full border border-gray-300 text-gray-700 px-4 py-2 rounded-md hover:bg-gray-50 disabled:opacity-50"
+                >
+                  {loadingProposals
+                    ? 'Loading...'
+                    : `Load more (${proposals.length} of ${totalProposals})`}
+                </button>
+              )}
             </div>
           )}
         </div>
@@ -23,6 +23,29 @@ export interface Proposal {
   freelancer_id: number;
 }
 
+export interface RankedProposal extends Proposal {
+  freelancer_reputation: number;
+}
+
+export interface BidStats {
+  min_bid: number | null;
+  median_bid: number | null;
+  max_bid: number | null;
+}
+
+export interface ProposalPage {
+  items: RankedProposal[];
+  total: number;
+  stats: BidStats;
+}
+
+export interface ProposalFilters {
+  sort?: 'bid_amount' | 'recent' | 'reputation';
+  skip?: number;
+  limit?: number;
+  include_cover_letter?: boolean;
+}
+
 export interface Contract {
   id: number;
   amount: number;
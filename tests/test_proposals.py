@@ -0,0 +1,172 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.models.contract import Contract
+from backend.models.job import Job
+from backend.models.proposal import Proposal
+from backend.models.user import User
+
+
+def make_user(db, email, role):
+    db_user = User(name=email.split("@")[0], email=email,
+                   hashed_password="x", role=role)
+    db.add(db_user)
+    db.commit()
+    return db_user
+
+
+def make_job(db, owner):
+    job = Job(title="Build a dashboard", budget=5000,
+              status="open", client_id=owner.id)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def add_proposals(db, job, bids):
+    """Insert (freelancer, bid_amount) pairs in order, returning their ids."""
+    proposals = [
+        Proposal(bid_amount=bid, cover_letter=f"I can do it for {bid}",
+                 job_id=job.id, freelancer_id=freelancer.id)
+        for freelancer, bid in bids
+    ]
+    db.add_all(proposals)
+    db.commit()
+    return [proposal.id for proposal in proposals]
+
+
+def complete_contracts(db, owner, freelancer, count):
+    for _ in range(count):
+        other_job = make_job(db, owner)
+        db.add(Contract(amount=100, status="completed",
+                        created_at=datetime.now(timezone.utc),
+                        job_id=other_job.id, freelancer_id=freelancer.id,
+                        client_id=owner.id))
+    db.commit()
+
+
+@pytest.fixture
+def owner(db, current_user):
+    db_user = make_user(db, "owner@example.com", "client")
+    current_user["user_id"] = db_user.id
+    return db_user
+
+
+@pytest.fixture
+def freelancers(db):
+    return [make_user(db, f"freelancer{i}@example.com", "freelancer") for i in range(3)]
+
+
+def test_sort_by_bid_amount(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], 300), (freelancers[1], 100),
+                            (freelancers[2], 200)])
+
+    response = client.get(f"/proposals/{job.id}", params={"sort": "bid_amount"})
+
+    assert response.status_code == 200
+    assert [p["bid_amount"] for p in response.json()["items"]] == [100, 200, 300]
+
+
+def test_sort_by_recent(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    ids = add_proposals(db, job, [(freelancers[0], 300), (freelancers[1], 100),
+                                  (freelancers[2], 200)])
+
+    response = client.get(f"/proposals/{job.id}", params={"sort": "recent"})
+
+    assert [p["id"] for p in response.json()["items"]] == list(reversed(ids))
+
+
+def test_sort_by_reputation(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], 100), (freelancers[1], 300),
+                            (freelancers[2], 200)])
+    complete_contracts(db, owner, freelancers[1], 2)
+    complete_contracts(db, owner, freelancers[2], 1)
+
+    response = client.get(f"/proposals/{job.id}", params={"sort": "reputation"})
+
+    items = response.json()["items"]
+    assert [p["freelancer_id"] for p in items] == [f.id for f in (
+        freelancers[1], freelancers[2], freelancers[0])]
+    assert [p["freelancer_reputation"] for p in items] == [2, 1, 0]
+
+
+def test_skip_and_limit_page_through_results(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[i % 3], bid)
+                            for i, bid in enumerate([50, 10, 40, 20, 30])])
+
+    response = client.get(f"/proposals/{job.id}",
+                          params={"sort": "bid_amount", "skip": 2, "limit": 2})
+
+    body = response.json()
+    assert [p["bid_amount"] for p in body["items"]] == [30, 40]
+    assert body["total"] == 5
+
+
+@pytest.mark.parametrize("bids, median", [
+    ([30, 10, 20], 20),
+    ([40, 10, 30, 20], 25),
+    ([7], 7),
+])
+def test_bid_stats(client, db, owner, freelancers, bids, median):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], bid) for bid in bids])
+
+    response = client.get(f"/proposals/{job.id}", params={"limit": 1})
+
+    assert response.json()["stats"] == {
+        "min_bid": min(bids), "median_bid": median, "max_bid": max(bids)}
+
+
+def test_bid_stats_for_job_without_proposals(client, db, owner):
+    job = make_job(db, owner)
+
+    response = client.get(f"/proposals/{job.id}")
+
+    assert response.json() == {
+        "items": [], "total": 0,
+        "stats": {"min_bid": None, "median_bid": None, "max_bid": None}}
+
+
+def test_omit_cover_letter(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], 100), (freelancers[1], 200)])
+
+    response = client.get(f"/proposals/{job.id}",
+                          params={"include_cover_letter": "false"})
+
+    items = response.json()["items"]
+    assert len(items) == 2
+    assert all(p["cover_letter"] is None for p in items)
+
+
+def test_top_proposals_returns_lowest_bids(client, db, owner, freelancers):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], 300), (freelancers[1], 100),
+                            (freelancers[2], 200)])
+
+    response = client.get(f"/proposals/{job.id}/top", params={"k": 2})
+
+    assert response.status_code == 200
+    assert [p["bid_amount"] for p in response.json()] == [100, 200]
+
+
+@pytest.mark.parametrize("path", ["/proposals/{job_id}", "/proposals/{job_id}/top"])
+def test_non_owner_is_forbidden(client, db, owner, freelancers, current_user, path):
+    job = make_job(db, owner)
+    add_proposals(db, job, [(freelancers[0], 100)])
+    current_user["user_id"] = freelancers[0].id
+
+    response = client.get(path.format(job_id=job.id))
+
+    assert response.status_code == 403
+
+
+def test_missing_job_returns_404(client, owner):
+    response = client.get("/proposals/9999")
+
+    assert response.status_code == 404